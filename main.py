@@ -1,8 +1,17 @@
 import sys
 import os
+import atexit
+import functools
+import subprocess
+import re
+import io
 import json
+import tarfile
+import threading
+import time
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import traceback  # for detailed error dialogs
 from PyQt5.QtWidgets import (
     QApplication,
@@ -23,138 +32,404 @@ from PyQt5.QtWidgets import (
     QFrame,
     QTabWidget,
     QAbstractItemView,
+    QTableView,
+    QStyledItemDelegate,
 )
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
+from PyQt5.QtCore import (
+    QThread,
+    QTimer,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QDateTime,
+)
+from PyQt5.QtGui import QBrush
 from dotenv import load_dotenv
+import orjson
 
 from uploader import UploadPostClient
+from task_names import task_file_name
 
 # Optional: pre-fill API key from environment (won't block UI on missing env)
 load_dotenv()
 ENV_API_KEY = os.getenv("API_KEY", "")
 ENV_PI_IP = os.getenv("PI_IP", "")
 ENV_SSH_KEY = os.getenv("SSH_KEY", str(Path.home() / ".ssh/pi_upload"))
+ENV_SSH_CIPHER = os.getenv("SSH_CIPHER", "")
+
+# Shared OpenSSH ControlMaster socket so all Pi commands reuse one connection
+SSH_CONTROL_PATH = str(Path.home() / ".ssh" / "cm-%r@%h:%p")
+
+class _UploadLogger:
+    """Buffered append-only JSONL writer for the desktop logs (upload_log.json, pi_test.log).
+
+    Bulk scheduler runs log one line per video, so entries collect in an 8 KiB buffer
+    and hit the disk every ``FLUSH_EVERY`` writes or when ``flush()`` is called.
+    """
+
+    FLUSH_EVERY = 16
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fp = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def log(self, payload: dict):
+        line = orjson.dumps(payload, option=orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE)
+        with self._lock:
+            if self._fp is None:
+                self.path.parent.mkdir(exist_ok=True)
+                self._fp = open(self.path, "ab", buffering=8192)
+            self._fp.write(line)
+            self._pending += 1
+            if self._pending >= self.FLUSH_EVERY:
+                self._fp.flush()
+                self._pending = 0
+
+    def flush(self):
+        with self._lock:
+            if self._fp is not None and self._pending:
+                self._fp.flush()
+                self._pending = 0
+
+    def close(self):
+        with self._lock:
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+                self._pending = 0
 
-class SchedulerWorker(QThread):
-    """Worker thread to perform scheduled uploads at specified datetimes."""
+_upload_logger = _UploadLogger(Path("logs") / "upload_log.json")
+atexit.register(_upload_logger.close)
+_pi_test_logger = _UploadLogger(Path("logs") / "pi_test.log")
+atexit.register(_pi_test_logger.close)
+
+# Minimum upload progress (bytes) between progress bar updates
+PROGRESS_MIN_BYTES = 256 * 1024
+
+# File suffixes the scheduler picks up from a folder (compared lower-cased)
+VIDEO_SUFFIXES = (".mp4", ".mov")
+VIDEO_FILE_FILTER = "Video Files (*.mp4 *.mov);;All Files (*)"
+
+# Longest interval a QTimer accepts (signed 32-bit milliseconds)
+MAX_TIMER_MS = 2**31 - 1
+
+def task_json_name(scheduled_time: datetime) -> str:
+    """Queue file name for a Pi task due at ``scheduled_time`` (see task_names)."""
+    return task_file_name(scheduled_time.timestamp())
+
+def ssh_mux_args(control_path: str) -> list:
+    """Return ssh/scp options that multiplex over the ControlMaster socket."""
+    return ["-o", f"ControlPath={control_path}", "-o", "ControlMaster=auto"]
+
+def preferred_ssh_cipher() -> str:
+    """Pick AES-GCM when the CPU has AES instructions, otherwise ChaCha20-Poly1305."""
+    try:
+        cpuinfo = Path("/proc/cpuinfo").read_text()
+    except OSError:
+        # macOS/Windows desktops all ship AES hardware
+        return "aes128-gcm@openssh.com"
+    if re.search(r"\baes\b", cpuinfo):
+        return "aes128-gcm@openssh.com"
+    return "chacha20-poly1305@openssh.com"
+
+def ssh_throughput_args(cipher: str) -> list:
+    """Return ssh/scp options tuned for bulk transfer of already-compressed video."""
+    return ["-o", "Compression=no", "-c", cipher, "-o", "IPQoS=throughput"]
+
+class WorkerSignals(QObject):
+    """Signals for pool tasks; QRunnable is not a QObject and cannot emit itself."""
     update_status = pyqtSignal(str)
-    finished_all = pyqtSignal()
+    finished = pyqtSignal()
+    progress = pyqtSignal(int, int)
+    done = pyqtSignal(dict)
+
+class UploadRunnable(QRunnable):
+    """Pool task that uploads one scheduled video.
 
-    def __init__(self, tasks: list, api_key: str, username: str):
+    Waiting for the scheduled time happens on a QTimer in the GUI thread; the
+    runnable is only started once the task is due, so no thread sits idle.
+    """
+
+    def __init__(self, task: tuple, client: UploadPostClient, username: str):
         super().__init__()
-        self.tasks = tasks  # list of dicts: {path, caption, scheduled_datetime}
-        self.api_key = api_key
+        self.task = task  # (path, file name, caption, scheduled epoch seconds)
+        self.client = client
         self.username = username
+        self.signals = WorkerSignals()
 
     def run(self):
-        from datetime import datetime
-        import time
-        client = UploadPostClient(self.api_key)
-        for task in self.tasks:
-            path = task["path"]
-            caption = task["caption"]
-            scheduled = task["scheduled_time"]
-            # compute wait time
-            now = datetime.now()
-            delay = (scheduled - now).total_seconds()
-            if delay > 0:
-                self.update_status.emit(f"Waiting {int(delay)}s before uploading {path.name}")
-                time.sleep(delay)
-            self.update_status.emit(f"Uploading {path.name}")
-            try:
-                resp = client.upload_video(video_path=path, caption=caption, user=self.username)
-                if resp.get("success"):
-                    self.update_status.emit(f"Uploaded {path.name}")
-                else:
-                    self.update_status.emit(f"Failed {path.name}: {resp}")
-            except Exception as ex:
-                self.update_status.emit(f"Error {path.name}: {ex}")
-        self.finished_all.emit()
+        path, name, caption, _ = self.task
+        self.signals.update_status.emit(f"Uploading {name}")
+        try:
+            resp = self.client.upload_video(video_path=path, caption=caption, user=self.username)
+            if resp.get("success"):
+                message = f"Uploaded {name}"
+            else:
+                message = f"Failed {name}: {resp}"
+        except Exception as ex:
+            message = f"Error {name}: {ex}"
+        self.signals.update_status.emit(message)
+        self.signals.finished.emit()
+
+def parse_log_line(line: bytes):
+    """Turn one journalctl line into a Pi Logs row, or None for blank lines."""
+    if line[:1] == b"{":
+        try:
+            data = orjson.loads(line)
+            return {
+                "timestamp": data.get("timestamp", ""),
+                "video": data.get("video", ""),
+                "user": data.get("user", ""),
+                "status": data.get("status", ""),
+                "message": data.get("error", data.get("message", "")),
+            }
+        except Exception:
+            pass
+    line = line.strip()
+    if not line:
+        return None
+    return {
+        "timestamp": "",
+        "video": "",
+        "user": "",
+        "status": "",
+        "message": line.decode("utf-8", errors="replace"),
+    }
 
-class LogsWorker(QThread):
-    """Worker thread to fetch Pi logs via SSH."""
-    logs_ready = pyqtSignal(list)
+class LogsTailWorker(QThread):
+    """Worker thread that follows the Pi worker's journal over SSH and streams rows."""
+    log_row_ready = pyqtSignal(dict)
 
-    def __init__(self, pi_ip: str, ssh_key: str):
-        super().__init__()
+    def __init__(self, pi_ip: str, ssh_key: str, control_path: str, parent=None):
+        super().__init__(parent)
         self.pi_ip = pi_ip
         # Expand ~ in SSH key path to full home directory
         self.ssh_key = str(Path(ssh_key).expanduser())
+        self.control_path = control_path
+        self._proc = None
+        self._stopped = False
+
+    def stop(self):
+        """Terminate the remote follower; run() returns once ssh exits."""
+        self._stopped = True
+        if self._proc is not None:
+            self._proc.terminate()
+
+    def run(self):
+        # Today's history first, then keep following new entries on the same channel
+        cmd = [
+            "ssh", *ssh_mux_args(self.control_path), "-i", self.ssh_key, f"pi@{self.pi_ip}",
+            "journalctl", "-u", "upload-worker", "--since", "today", "-f", "--no-pager", "-o", "cat",
+        ]
+        # The with block closes the stdout pipe and reaps ssh, so repeated refreshes don't leak fds
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=1 << 20) as proc:
+            self._proc = proc
+            if self._stopped:
+                proc.terminate()
+            for line in proc.stdout:
+                row = parse_log_line(line)
+                if row is not None:
+                    self.log_row_ready.emit(row)
+
+class SingleUploadRunnable(QRunnable):
+    """Pool task that runs a single upload without blocking the GUI."""
+
+    def __init__(self, client: UploadPostClient, file_path: Path, caption: str, user: str):
+        super().__init__()
+        self.client = client
+        self.file_path = file_path
+        self.caption = caption
+        self.user = user
+        self.signals = WorkerSignals()
+        self._last_bytes = 0
+        self._last_pct = -1
 
     def run(self):
-        import subprocess, json
-        cmd = f"ssh -i {self.ssh_key} pi@{self.pi_ip} journalctl -u upload-worker --since today --no-pager -o cat"
         try:
-            text = subprocess.check_output(cmd, shell=True, stderr=subprocess.DEVNULL, universal_newlines=True)
-        except subprocess.CalledProcessError:
-            text = ""
-        rows = []
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-                row = {
-                    "timestamp": data.get("timestamp", ""),
-                    "video": data.get("video", ""),
-                    "user": data.get("user", ""),
-                    "status": data.get("status", ""),
-                    "message": data.get("error", data.get("message", "")),
-                }
-            except Exception:
-                row = {
-                    "timestamp": "",
-                    "video": "",
-                    "user": "",
-                    "status": "",
-                    "message": line,
-                }
-            rows.append(row)
-        self.logs_ready.emit(rows)
-
-class SCPWorker(QThread):
-    """Worker thread to perform non-blocking SCP with progress updates."""
+            response = self.client.upload_video(
+                video_path=self.file_path,
+                caption=self.caption,
+                user=self.user,
+                platforms=None,  # default to TikTok
+                progress_callback=self._on_progress,
+            )
+        except Exception as ex:
+            response = {"error": str(ex), "traceback": traceback.format_exc()}
+        self.signals.done.emit(response)
+
+    def _on_progress(self, monitor):
+        """Emit progress at most once per PROGRESS_MIN_BYTES and once per whole percent.
+
+        Passing a callback routes every upload through the streaming encoder, which reports
+        once per block the connection reads (the client adapter's BLOCKSIZE); gating here
+        keeps the cross-thread signal (and its queued event) off the hot path. The monitor keeps changing on this thread,
+        so the GUI gets plain ints.
+        """
+        bytes_read, total = monitor.bytes_read, monitor.len
+        if bytes_read - self._last_bytes < PROGRESS_MIN_BYTES and bytes_read < total:
+            return
+        percent = bytes_read * 100 // total if total else 0
+        if percent == self._last_pct:
+            return
+        self._last_bytes = bytes_read
+        self._last_pct = percent
+        self.signals.progress.emit(bytes_read, total)
+
+class LogsModel(QAbstractTableModel):
+    """Table model for Pi log rows; cells are produced lazily by the view."""
+    COLUMNS = ["timestamp", "video", "user", "status", "message"]
+    HEADERS = ["Timestamp", "Video", "User", "Status", "Message"]
+    STATUS_BRUSHES = {"ok": QBrush(Qt.green), "error": QBrush(Qt.red)}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_rows(self, rows: list):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def append_row(self, row: dict):
+        n = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n, n)
+        self._rows.append(row)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return str(row.get(self.COLUMNS[index.column()], ""))
+        if role == Qt.BackgroundRole:
+            # Color based on status
+            return self.STATUS_BRUSHES.get(row.get("status", ""))
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+class ScheduleTimeDelegate(QStyledItemDelegate):
+    """Date/time editor for the scheduler's Time column, created only while a cell is edited."""
+
+    def createEditor(self, parent, option, index):
+        editor = QDateTimeEdit(parent)
+        editor.setCalendarPopup(True)
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setDateTime(index.data(Qt.EditRole))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.dateTime(), Qt.EditRole)
+
+class _ProgressWriter:
+    """Write-only file object that forwards to ``fp`` and reports percent of ``total`` sent."""
+
+    def __init__(self, fp, total: int, on_percent):
+        self.fp = fp
+        self.total = total or 1
+        self.on_percent = on_percent
+        self.written = 0
+        self._last_percent = -1
+
+    def write(self, data) -> int:
+        self.fp.write(data)
+        self.written += len(data)
+        percent = min(100, self.written * 100 // self.total)
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.on_percent(percent)
+        return len(data)
+
+class BulkSCPWorker(QThread):
+    """Worker thread to stream one or more videos and their task JSON to the Pi in one SSH session.
+
+    The tar stream is built in-process and written straight into ssh's stdin, so
+    task JSON never touches the local disk. It is left uncompressed: the videos are
+    already entropy-coded and gzip would only cap throughput on the CPU.
+    """
     progress = pyqtSignal(int)
     finished = pyqtSignal(bool)
 
-    def __init__(self, video_path: str, json_path: str, ssh_key: str, pi_ip: str):
+    # Large tar records mean fewer, bigger writes into the ssh pipe
+    BUFSIZE = 1 << 20
+
+    def __init__(self, tasks: list, ssh_key: str, pi_ip: str, control_path: str,
+                 cipher: str = "aes128-gcm@openssh.com"):
         super().__init__()
-        self.video_path = video_path
-        self.json_path = json_path
+        # (video_path, task file name, task JSON bytes)
+        self.tasks = [(Path(video), name, task_json) for video, name, task_json in tasks]
         self.ssh_key = ssh_key
         self.pi_ip = pi_ip
+        self.control_path = control_path
+        self.cipher = cipher
 
     def run(self):
-        import subprocess, shlex
-        # Emit indeterminate until we parse a percentage
+        # Emit indeterminate until the first chunk is written
         self.progress.emit(-1)
-        cmd = f"scp -v -C -i {shlex.quote(self.ssh_key)} {shlex.quote(self.video_path)} {shlex.quote(self.json_path)} pi@{self.pi_ip}:/home/pi/upload_queue/"
-        p = subprocess.Popen(cmd, shell=True, stderr=subprocess.PIPE, universal_newlines=True)
-        for line in p.stderr:
-            if '%' in line:
-                try:
-                    perc = int(line.strip().split('%')[0])
-                    self.progress.emit(perc)
-                except:
-                    continue
-        p.wait()
-        success = (p.returncode == 0)
-        self.finished.emit(success)
-        # cleanup JSON file locally
+        ssh = subprocess.Popen(
+            ["ssh", *ssh_throughput_args(self.cipher), *ssh_mux_args(self.control_path),
+             "-i", self.ssh_key, f"pi@{self.pi_ip}",
+             "tar", "-xf", "-", "-C", "/home/pi/upload_queue/"],
+            stdin=subprocess.PIPE,
+        )
+        success = True
         try:
-            import os
-            os.remove(self.json_path)
-        except Exception:
-            pass
+            total = sum(video.stat().st_size for video, _, _ in self.tasks)
+            sink = _ProgressWriter(ssh.stdin, total, self.progress.emit)
+            with tarfile.open(mode="w|", fileobj=sink, bufsize=self.BUFSIZE) as tar:
+                for video, name, task_json in self.tasks:
+                    # Each video lands before its task JSON so the Pi worker never sees a partial file
+                    tar.add(str(video), arcname=video.name)
+                    info = tarfile.TarInfo(name=name)
+                    info.size = len(task_json)
+                    info.mtime = int(time.time())
+                    tar.addfile(info, io.BytesIO(task_json))
+        except (OSError, tarfile.TarError):
+            success = False
+        finally:
+            try:
+                ssh.stdin.close()
+            except OSError:
+                pass
+        ssh.wait()
+        self.finished.emit(success and ssh.returncode == 0)
 
 class UserPanel(QWidget):
     """Panel for a single Upload-Post user: single uploads and scheduling."""
-    def __init__(self, api_key_edit: QLineEdit, pi_ip_edit: QLineEdit, ssh_key_edit: QLineEdit, parent=None):
+
+    _last_browse_dir = ""  # shared by all panels so every browse opens where the last one left off
+
+    def __init__(self, api_key_edit: QLineEdit, get_client, pi_ip_edit: QLineEdit, ssh_key_edit: QLineEdit,
+                 control_path: str, ssh_cipher: str, parent=None):
         super().__init__(parent)
         self.api_key_edit = api_key_edit
+        self.get_client = get_client  # api_key -> shared UploadPostClient owned by MainWindow
         self.pi_ip_edit = pi_ip_edit
         self.ssh_key_edit = ssh_key_edit
+        self.control_path = control_path
+        self.ssh_cipher = ssh_cipher
+        self._pending_timers = {}  # path -> (single-shot QTimer, task) for not-yet-due uploads
+        self._uploads_in_flight = 0
+        self._video_listing = None  # (directory, mtime_ns, sorted videos) from the last folder scan
+        self._file_dialog = None  # created on first browse and reused
+        self._folder_dialog = None
         self._build_ui()
 
     def _build_ui(self):
@@ -188,9 +463,9 @@ class UserPanel(QWidget):
         layout.addWidget(self.progress_bar)
 
         # Upload button
-        upload_btn = QPushButton("Upload to TikTok")
-        upload_btn.clicked.connect(self._do_upload)
-        layout.addWidget(upload_btn)
+        self.upload_btn = QPushButton("Upload to TikTok")
+        self.upload_btn.clicked.connect(self._do_upload)
+        layout.addWidget(self.upload_btn)
 
         # Scheduler toggle
         self.scheduler_checkbox = QCheckBox("Enable Scheduler")
@@ -201,23 +476,35 @@ class UserPanel(QWidget):
         self.scheduler_panel = QFrame()
         sched_layout = QVBoxLayout(self.scheduler_panel)
         self.select_folder_btn = QPushButton("Select Folder for Scheduler")
-        self.select_folder_btn.clicked.connect(self._populate_scheduler_table)
+        self.select_folder_btn.clicked.connect(self._browse_folder)
         sched_layout.addWidget(self.select_folder_btn)
         self.scheduler_table = QTableWidget(0,4)
         self.scheduler_table.setHorizontalHeaderLabels(["Video","Caption","Time","Remaining"])
         self.scheduler_table.setDragDropMode(QAbstractItemView.InternalMove)
         self.scheduler_table.setDragDropOverwriteMode(False)
         self.scheduler_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        # Caption/Time cells are plain items; editors exist only while a cell is being edited
+        self.scheduler_table.setEditTriggers(QAbstractItemView.AllEditTriggers)
+        self.scheduler_table.setItemDelegateForColumn(2, ScheduleTimeDelegate(self.scheduler_table))
+        self.scheduler_table.itemChanged.connect(self._on_scheduler_item_changed)
         sched_layout.addWidget(self.scheduler_table)
         self.schedule_status_lbl = QLabel("")
         sched_layout.addWidget(self.schedule_status_lbl)
         self.refresh_btn = QPushButton("Refresh Schedule")
         self.refresh_btn.clicked.connect(self._refresh_schedule_status)
+        # Live countdown for the Remaining column, ticking only while the scheduler is shown;
+        # the button stays as a force-update
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(1000)
+        self._refresh_timer.timeout.connect(self._on_refresh_tick)
         self.start_schedule_btn = QPushButton("Start Scheduling")
         self.start_schedule_btn.clicked.connect(self._start_scheduling)
+        self.cancel_schedule_btn = QPushButton("Cancel Scheduling")
+        self.cancel_schedule_btn.clicked.connect(self._cancel_scheduling)
         row = QHBoxLayout()
         row.addWidget(self.refresh_btn)
         row.addWidget(self.start_schedule_btn)
+        row.addWidget(self.cancel_schedule_btn)
         sched_layout.addLayout(row)
         self.run_on_pi_checkbox = QCheckBox("Run on Pi")
         sched_layout.addWidget(self.run_on_pi_checkbox)
@@ -225,23 +512,26 @@ class UserPanel(QWidget):
         layout.addWidget(self.scheduler_panel)
 
     def _browse_file(self):
-        path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select video file",
-            "",
-            "Video Files (*.mp4 *.mov);;All Files (*)",
-        )
-        if path:
-            self.file_edit.setText(path)
+        # open() returns immediately, so upload progress keeps painting while the dialog is up
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self, "Select video file", UserPanel._last_browse_dir, VIDEO_FILE_FILTER)
+            self._file_dialog.setFileMode(QFileDialog.ExistingFile)
+            self._file_dialog.fileSelected.connect(self._on_file_chosen)
+        elif UserPanel._last_browse_dir:
+            self._file_dialog.setDirectory(UserPanel._last_browse_dir)
+        self._file_dialog.open()
+
+    def _on_file_chosen(self, path: str):
+        UserPanel._last_browse_dir = os.path.dirname(path)
+        self.file_edit.setText(path)
 
     def _log_result(self, payload: dict):
-        payload["timestamp"] = datetime.utcnow().isoformat()
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        log_file = log_dir / "upload_log.json"
-        with log_file.open("a", encoding="utf-8") as fp:
-            json.dump(payload, fp)
-            fp.write("\n")
+        payload["timestamp"] = datetime.now(timezone.utc)
+        _upload_logger.log(payload)
+
+    def _get_client(self) -> UploadPostClient:
+        """Return the window-wide client for the API key currently entered."""
+        return self.get_client(self.api_key_edit.text().strip())
 
     def _do_upload(self):
         # Read and validate API key from UI
@@ -250,7 +540,7 @@ class UserPanel(QWidget):
             QMessageBox.warning(self, "Validation Error", "API Key is required.")
             return
         try:
-            client = UploadPostClient(api_key)
+            client = self._get_client()
         except Exception as e:
             QMessageBox.critical(self, "Invalid API Key", str(e))
             return
@@ -275,19 +565,30 @@ class UserPanel(QWidget):
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(True)
         self.status_lbl.setText("Uploading...")
-        QApplication.processEvents()
+        self._upload_args = {"file": str(file_path), "caption": caption, "username": user}
 
+        # Run the HTTP request on the shared pool so the normal event loop keeps painting
+        # and other panels can upload at the same time; one upload per panel at a time,
+        # the button comes back in _on_upload_finished
+        self.upload_btn.setEnabled(False)
+        runnable = SingleUploadRunnable(client, file_path, caption, user)
+        runnable.signals.progress.connect(self._update_progress, Qt.QueuedConnection)
+        runnable.signals.done.connect(self._on_upload_finished, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_upload_finished(self, response: dict):
         try:
-            # upload with progress callback
-            response = client.upload_video(
-                video_path=file_path,
-                caption=caption,
-                user=user,
-                platforms=None,  # default to TikTok
-                progress_callback=self._update_progress,
-            )
+            if "traceback" in response:
+                # Show status and a detailed error dialog
+                self.status_lbl.setText("❌ Error")
+                dlg = QMessageBox(self)
+                dlg.setWindowTitle("Error during upload")
+                dlg.setIcon(QMessageBox.Critical)
+                dlg.setText(response["error"])
+                dlg.setDetailedText(response["traceback"])
+                dlg.exec_()
             # Check top-level success and per-platform results
-            if not response.get("success"):
+            elif not response.get("success"):
                 self.status_lbl.setText("❌ Upload failed.")
                 QMessageBox.critical(self, "Upload Failed", str(response))
             else:
@@ -303,97 +604,129 @@ class UserPanel(QWidget):
                     QMessageBox.critical(self, "Upload Failed", "; ".join(errors))
                 else:
                     self.status_lbl.setText("✅ Upload successful!")
-        except Exception as ex:
-            # Show status and a detailed error dialog
-            self.status_lbl.setText("❌ Error")
-            err_msg = str(ex)
-            tb = traceback.format_exc()
-            dlg = QMessageBox(self)
-            dlg.setWindowTitle("Error during upload")
-            dlg.setIcon(QMessageBox.Critical)
-            dlg.setText(err_msg)
-            dlg.setDetailedText(tb)
-            dlg.exec_()
-            response = {"error": err_msg, "traceback": tb}
         finally:
             # hide progress bar after completion
             self.progress_bar.setVisible(False)
-            self._log_result({
-                "file": str(file_path),
-                "caption": caption,
-                "username": user,
-                "response": response,
-            })
+            self.upload_btn.setEnabled(True)
+            self._log_result({**self._upload_args, "response": response})
 
     def _update_progress(self, bytes_read: int, total: int):
-        """Update the progress bar with bytes_read/total."""
-        percent = int(bytes_read / total * 100) if total else 0
-        self.progress_bar.setValue(percent)
-        QApplication.processEvents()
+        """Update the progress bar with bytes_read/total (already coalesced by the runnable)."""
+        self.progress_bar.setValue(bytes_read * 100 // total if total else 0)
 
     def _toggle_scheduler_panel(self, checked: bool):
         # Show/hide scheduler panel and single-upload panel
         self.scheduler_panel.setVisible(checked)
+        if checked and self.scheduler_table.rowCount():
+            self._refresh_schedule_status()
+            self._refresh_timer.start()
+        else:
+            self._refresh_timer.stop()
         self.adjustSize()
 
-    def _populate_scheduler_table(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Video Folder")
+    def _browse_folder(self):
+        # Same as _browse_file: no nested event loop while the user picks a folder
+        if self._folder_dialog is None:
+            self._folder_dialog = QFileDialog(self, "Select Video Folder")
+            self._folder_dialog.setFileMode(QFileDialog.Directory)
+            self._folder_dialog.setOption(QFileDialog.ShowDirsOnly, True)
+            self._folder_dialog.fileSelected.connect(self._populate_scheduler_table)
+        self._folder_dialog.open()
+
+    def _populate_scheduler_table(self, directory: str):
         if not directory:
             return
-        from pathlib import Path
         self.scheduler_folder = Path(directory)
-        videos = sorted(self.scheduler_folder.glob("*.mp4")) + sorted(self.scheduler_folder.glob("*.mov"))
+        videos = self._list_videos(directory)
         if not videos:
             QMessageBox.warning(self, "No Videos", "No .mp4 or .mov files found in that folder.")
             return
-        self.scheduler_table.setRowCount(len(videos))
-        from datetime import datetime, timedelta
-        for row, path in enumerate(videos):
-            # Video file name
-            file_item = QTableWidgetItem(path.name)
-            file_item.setFlags(file_item.flags() & ~Qt.ItemIsEditable)
-            self.scheduler_table.setItem(row, 0, file_item)
-            # Caption input
-            caption_edit = QLineEdit(self.scheduler_panel)
-            self.scheduler_table.setCellWidget(row, 1, caption_edit)
-            # Scheduled time picker
-            dt_edit = QDateTimeEdit(datetime.now() + timedelta(minutes=60), self.scheduler_panel)
-            dt_edit.setCalendarPopup(True)
-            self.scheduler_table.setCellWidget(row, 2, dt_edit)
-            # Time remaining placeholder
-            time_item = QTableWidgetItem("")
-            time_item.setFlags(time_item.flags() & ~Qt.ItemIsEditable)
-            self.scheduler_table.setItem(row, 3, time_item)
+        # Defer repaints and model signals until every row is in place
+        self.scheduler_table.setUpdatesEnabled(False)
+        self.scheduler_table.blockSignals(True)
+        try:
+            self.scheduler_table.setRowCount(len(videos))
+            # Same read-only flags for every name/remaining cell
+            read_only = Qt.ItemFlags(QTableWidgetItem().flags() & ~Qt.ItemIsEditable)
+            default_time = QDateTime.currentDateTime().addSecs(3600)
+            default_ts = default_time.toSecsSinceEpoch()
+            for row, path in enumerate(videos):
+                # Video file name; UserRole carries the path so rows keep their identity when moved
+                file_item = QTableWidgetItem(path.name)
+                file_item.setData(Qt.UserRole, path)
+                file_item.setFlags(read_only)
+                self.scheduler_table.setItem(row, 0, file_item)
+                # Caption, edited in place by the default line-edit delegate
+                caption_item = QTableWidgetItem("")
+                self.scheduler_table.setItem(row, 1, caption_item)
+                # Scheduled time; UserRole caches its epoch seconds, kept in sync with the picker
+                dt_item = QTableWidgetItem()
+                dt_item.setData(Qt.EditRole, default_time)
+                dt_item.setData(Qt.UserRole, default_ts)
+                self.scheduler_table.setItem(row, 2, dt_item)
+                # Time remaining placeholder
+                time_item = QTableWidgetItem("")
+                time_item.setFlags(read_only)
+                self.scheduler_table.setItem(row, 3, time_item)
+        finally:
+            self.scheduler_table.blockSignals(False)
+            self.scheduler_table.setUpdatesEnabled(True)
+        self.scheduler_table.resizeRowsToContents()
         self.scheduler_table.horizontalHeader().setStretchLastSection(True)
+        self._refresh_schedule_status()
+        if self.scheduler_panel.isVisible():
+            self._refresh_timer.start()
+
+    def _list_videos(self, directory: str) -> list:
+        """Return the folder's videos sorted by name, reusing the last scan if the folder is unchanged."""
+        mtime_ns = os.stat(directory).st_mtime_ns
+        cached = self._video_listing
+        if cached is not None and cached[0] == directory and cached[1] == mtime_ns:
+            return cached[2]
+        # One directory pass; suffix match is case-insensitive so .MP4/.MOV are picked up too
+        with os.scandir(directory) as it:
+            videos = sorted(
+                (Path(e.path) for e in it if e.is_file() and e.name.lower().endswith(VIDEO_SUFFIXES)),
+                key=lambda p: p.name,
+            )
+        self._video_listing = (directory, mtime_ns, videos)
+        return videos
 
     def _refresh_schedule_status(self):
-        # Update the Time Remaining column based on scheduled time
-        from datetime import datetime
+        # Update the Time Remaining column from the cached scheduled timestamps
+        # Items are looked up per row on every tick: a drag-drop move replaces them
+        now = int(time.time())
         for row in range(self.scheduler_table.rowCount()):
-            dt_edit = self.scheduler_table.cellWidget(row, 2)
-            scheduled = dt_edit.dateTime().toPyDateTime()
-            now = datetime.now()
-            diff = scheduled - now
-            if diff.total_seconds() > 0:
-                secs = int(diff.total_seconds())
-                hrs, rem = divmod(secs, 3600)
-                mins, secs = divmod(rem, 60)
-                text = f"{hrs}h {mins}m {secs}s"
-            else:
-                text = "Due"
+            scheduled = self._row_ts(row)
             item = self.scheduler_table.item(row, 3)
-            if item:
-                item.setText(text)
+            if scheduled is None or item is None:
+                continue
+            secs = max(0, scheduled - now)
+            # Skip the setText (and the repaint it triggers) when the shown value is unchanged;
+            # the last shown seconds ride on the item so they move with it (0 means "Due")
+            if secs == item.data(Qt.UserRole):
+                continue
+            item.setData(Qt.UserRole, secs)
+            item.setText(str(timedelta(seconds=secs)) if secs else "Due")
+
+    def _on_refresh_tick(self):
+        # The checkbox keeps the timer running behind the Pi Logs tab or a minimised window;
+        # skip those ticks, the first one after the panel is back catches the countdown up
+        if not self.scheduler_panel.isVisible() or self.window().isMinimized():
+            return
+        self._refresh_schedule_status()
 
     def _start_scheduling(self):
-        # Gather tasks from the scheduler table
-        tasks = []
-        for row in range(self.scheduler_table.rowCount()):
-            file_name = self.scheduler_table.item(row, 0).text()
-            path = self.scheduler_folder / file_name
-            caption = self.scheduler_table.cellWidget(row, 1).text().strip()
-            scheduled = self.scheduler_table.cellWidget(row, 2).dateTime().toPyDateTime()
-            tasks.append({"path": path, "caption": caption, "scheduled_time": scheduled})
+        # Gather (path, name, caption, epoch seconds) tasks from the scheduler table, soonest first
+        rows = [(row, self._row_path(row), self._row_ts(row)) for row in range(self.scheduler_table.rowCount())]
+        tasks = sorted(
+            (
+                (path, path.name, self._row_caption(row), ts)
+                for row, path, ts in rows
+                if path is not None and ts is not None
+            ),
+            key=itemgetter(3),
+        )
         api_key = self.api_key_edit.text().strip()
         username = self.user_edit.text().strip()
         if not tasks or not api_key or not username:
@@ -402,113 +735,231 @@ class UserPanel(QWidget):
         # Update schedule status label and refresh time remaining
         self._refresh_schedule_status()
         self.schedule_status_lbl.setText("Videos scheduled for upload")
-        # If opted to run on Pi, send tasks via SCP and return
+        # If opted to run on Pi, stream the tasks over SSH and return
         if self.run_on_pi_checkbox.isChecked():
-            for task in tasks:
-                try:
-                    self._send_to_pi(task["path"], task["caption"], username, task["scheduled_time"])
-                    self.status_lbl.setText(f"Queued {task['path'].name} on Pi ✓")
-                except Exception as e:
-                    QMessageBox.critical(self, "Error sending to Pi", str(e))
+            try:
+                entries = [
+                    (
+                        path,
+                        task_json_name(datetime.fromtimestamp(ts)),
+                        self._task_json_bytes(path, caption, username, datetime.fromtimestamp(ts)),
+                    )
+                    for path, _, caption, ts in tasks
+                ]
+                self._send_batch_to_pi(entries)
+            except Exception as e:
+                QMessageBox.critical(self, "Error sending to Pi", str(e))
+            return
+        # Replace any schedule that is still pending; uploads already running carry on
+        self._stop_pending_timers()
+        client = self._get_client()
+        # Already-due rows go straight to the upload pool; the rest wait on single-shot timers
+        now_ts = int(time.time())
+        for task in tasks:
+            path, ts = task[0], task[3]
+            if ts <= now_ts:
+                self._dispatch_upload(client, username, task)
+            else:
+                timer = QTimer(self)
+                timer.setSingleShot(True)
+                timer.timeout.connect(functools.partial(self._on_task_timer, client, username, path))
+                self._pending_timers[path] = (timer, task)
+                self._arm_timer(timer, ts)
+
+    def _row_path(self, row: int):
+        """Return the video path shown in ``row``, or None if the row has no file cell."""
+        item = self.scheduler_table.item(row, 0)
+        return item.data(Qt.UserRole) if item is not None else None
+
+    def _row_ts(self, row: int):
+        """Return the scheduled epoch seconds cached on ``row``'s time cell, or None if it has none."""
+        item = self.scheduler_table.item(row, 2)
+        return item.data(Qt.UserRole) if item is not None else None
+
+    def _row_caption(self, row: int) -> str:
+        item = self.scheduler_table.item(row, 1)
+        return item.text().strip() if item is not None else ""
+
+    def _stop_pending_timers(self) -> int:
+        """Drop every not-yet-due upload and return how many were pending."""
+        cancelled = len(self._pending_timers)
+        for timer, _ in self._pending_timers.values():
+            timer.stop()
+            timer.deleteLater()
+        self._pending_timers.clear()
+        return cancelled
+
+    def _cancel_scheduling(self):
+        # Uploads already running are left to finish
+        cancelled = self._stop_pending_timers()
+        if cancelled:
+            self.schedule_status_lbl.setText(f"Cancelled {cancelled} scheduled uploads")
+
+    def _arm_timer(self, timer: QTimer, ts: int):
+        # QTimer intervals are signed 32-bit ms (~24 days); longer waits re-arm on expiry
+        delay_ms = max(0, int((ts - time.time()) * 1000))
+        timer.start(min(delay_ms, MAX_TIMER_MS))
+
+    def _on_task_timer(self, client: UploadPostClient, username: str, path: Path):
+        entry = self._pending_timers.get(path)
+        if entry is None:
             return
-        # Start scheduler worker
-        self.scheduler_worker = SchedulerWorker(tasks, api_key, username)
-        self.scheduler_worker.update_status.connect(lambda msg: self.status_lbl.setText(msg))
-        self.scheduler_worker.finished_all.connect(lambda: QMessageBox.information(self, "Done", "All scheduled uploads complete."))
-        self.scheduler_worker.start()
-
-    def _send_to_pi(self, video_path, caption, user, scheduled_time):
-        from pathlib import Path
-        import json
-        # Prepare task JSON file
+        timer, task = entry
+        if task[3] > time.time():
+            self._arm_timer(timer, task[3])
+            return
+        self._dispatch_due(client, username)
+
+    def _dispatch_due(self, client: UploadPostClient, username: str):
+        """Hand every task that is due now to the pool in one pass so same-time uploads run together."""
+        now = time.time()
+        due = [path for path, (_, task) in self._pending_timers.items() if task[3] <= now]
+        for path in due:
+            timer, task = self._pending_timers.pop(path)
+            timer.stop()
+            timer.deleteLater()
+            self._dispatch_upload(client, username, task)
+
+    def _dispatch_upload(self, client: UploadPostClient, username: str, task: tuple):
+        runnable = UploadRunnable(task, client, username)
+        runnable.signals.update_status.connect(self.status_lbl.setText, Qt.QueuedConnection)
+        runnable.signals.finished.connect(self._on_upload_runnable_finished, Qt.QueuedConnection)
+        self._uploads_in_flight += 1
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_upload_runnable_finished(self):
+        self._uploads_in_flight -= 1
+        if not self._uploads_in_flight and not self._pending_timers:
+            self._on_all_done()
+
+    def _on_all_done(self):
+        QMessageBox.information(self, "Done", "All scheduled uploads complete.")
+
+    def _on_scheduler_item_changed(self, item: QTableWidgetItem):
+        if item.column() != 2:
+            return
+        ts = item.data(Qt.EditRole).toSecsSinceEpoch()
+        # A drag-drop move re-sets the item without changing its time; nothing to reschedule
+        if ts == item.data(Qt.UserRole):
+            return
+        item.setData(Qt.UserRole, ts)
+        path = self._row_path(item.row())
+        if path is not None:
+            self._reschedule_task(path, ts)
+
+    def _reschedule_task(self, path: Path, ts: int):
+        """Apply a time edit to the running local schedule without restarting it."""
+        entry = self._pending_timers.get(path)
+        if entry is not None:
+            timer, task = entry
+            self._pending_timers[path] = (timer, task[:3] + (ts,))
+            self._arm_timer(timer, ts)
+
+    def _task_json_bytes(self, video_path, caption, user, scheduled_time) -> bytes:
+        """Serialize the Pi worker's task description for one video."""
         task = {
             "video": Path(video_path).name,
             "caption": caption,
             "user": user,
             "scheduled_at": scheduled_time.isoformat()
         }
-        tmp_json = Path(video_path).with_suffix(".task.json")
-        tmp_json.write_text(json.dumps(task))
+        return json.dumps(task).encode()
+
+    def _on_pi_progress(self, val: int):
+        """Handle indeterminate (-1) and percentage progress from Pi transfers."""
+        if val < 0:
+            # Indeterminate mode
+            self.progress_bar.setRange(0, 0)
+        else:
+            # Ensure determinate mode
+            if self.progress_bar.maximum() == 0:
+                self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(val)
+
+    def _send_batch_to_pi(self, entries: list):
+        """Send (video_path, task file name, task JSON bytes) entries to the Pi in a single SSH session."""
         pi_ip = self.pi_ip_edit.text().strip()
         # Expand ~ in SSH key path to full home directory
         ssh_key = str(Path(self.ssh_key_edit.text().strip()).expanduser())
         # Show and reset progress bar
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(True)
-        # Start SCP in background thread
-        self.scp_worker = SCPWorker(
-            video_path=str(video_path),
-            json_path=str(tmp_json),
+        self.bulk_scp_worker = BulkSCPWorker(
+            tasks=entries,
             ssh_key=ssh_key,
             pi_ip=pi_ip,
+            control_path=self.control_path,
+            cipher=self.ssh_cipher,
         )
-        # Connect progress to handle indeterminate and value updates
-        def _on_scp_progress(val: int):
-            if val < 0:
-                # Indeterminate mode
-                self.progress_bar.setRange(0, 0)
-            else:
-                # Ensure determinate mode
-                if self.progress_bar.maximum() == 0:
-                    self.progress_bar.setRange(0, 100)
-                self.progress_bar.setValue(val)
-        self.scp_worker.progress.connect(_on_scp_progress)
-        def _on_scp_finished(success: bool):
+        self.bulk_scp_worker.progress.connect(self._on_pi_progress)
+        def _on_bulk_finished(success: bool):
             self.progress_bar.setVisible(False)
-            from pathlib import Path as _P
+            what = entries[0][0].name if len(entries) == 1 else f"{len(entries)} videos"
             if success:
-                self.status_lbl.setText(f"Queued {_P(video_path).name} on Pi ✓")
+                self.status_lbl.setText(f"Queued {what} on Pi ✓")
             else:
-                QMessageBox.critical(self, "SCP Error", f"Failed to send {_P(video_path).name} to Pi.")
-        self.scp_worker.finished.connect(_on_scp_finished)
-        self.scp_worker.start()
+                QMessageBox.critical(self, "SCP Error", f"Failed to send {what} to Pi.")
+        self.bulk_scp_worker.finished.connect(_on_bulk_finished)
+        self.bulk_scp_worker.start()
 
 class PiTestWorker(QThread):
     """Worker thread to test SSH connection to Pi."""
     test_result = pyqtSignal(bool, str)
 
-    def __init__(self, pi_ip: str, ssh_key: str):
+    def __init__(self, pi_ip: str, ssh_key: str, control_path: str):
         super().__init__()
         self.pi_ip = pi_ip
         # Expand ~ in SSH key path
         self.ssh_key = str(Path(ssh_key).expanduser())
+        self.control_path = control_path
 
     def run(self):
-        import subprocess, shlex, json
-        from pathlib import Path
-        from datetime import datetime
-        # Build SSH command
-        cmd = f"ssh -o BatchMode=yes -i {shlex.quote(self.ssh_key)} pi@{self.pi_ip} echo ok"
         success = False
         message = ""
+        # Fast path: a live ControlMaster answers locally, no new handshake needed
         try:
-            output = subprocess.check_output(
-                cmd, shell=True, stderr=subprocess.STDOUT,
-                universal_newlines=True, timeout=10
+            check = subprocess.run(
+                ["ssh", "-o", f"ControlPath={self.control_path}", "-O", "check", f"pi@{self.pi_ip}"],
+                capture_output=True, timeout=2,
             )
-            if output.strip() == "ok":
+            if check.returncode == 0:
                 success = True
                 message = "Connection successful"
-            else:
-                message = f"Unexpected response: {output.strip()}"
-        except subprocess.CalledProcessError as e:
-            message = f"SSH error {e.returncode}: {e.output.strip()}"
-        except subprocess.TimeoutExpired:
-            message = "SSH timed out"
-        except Exception as e:
-            message = f"{type(e).__name__}: {str(e)}"
+        except Exception:
+            pass
+        if not success:
+            # Full login; ControlPersist leaves the new master running for later commands
+            cmd = [
+                "ssh", "-o", "BatchMode=yes", *ssh_mux_args(self.control_path), "-o", "ControlPersist=10m",
+                "-i", self.ssh_key, f"pi@{self.pi_ip}", "echo", "ok",
+            ]
+            try:
+                output = subprocess.check_output(
+                    cmd, stderr=subprocess.STDOUT,
+                    universal_newlines=True, timeout=10
+                )
+                if output.strip() == "ok":
+                    success = True
+                    message = "Connection successful"
+                else:
+                    message = f"Unexpected response: {output.strip()}"
+            except subprocess.CalledProcessError as e:
+                message = f"SSH error {e.returncode}: {e.output.strip()}"
+            except subprocess.TimeoutExpired:
+                message = "SSH timed out"
+            except Exception as e:
+                message = f"{type(e).__name__}: {str(e)}"
         # Log the test result to logs/pi_test.log
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "pi_ip": self.pi_ip,
             "ssh_key": self.ssh_key,
             "success": success,
             "message": message,
         }
-        with (log_dir / "pi_test.log").open("a", encoding="utf-8") as log_file:
-            log_file.write(json.dumps(log_entry) + "\n")
+        _pi_test_logger.log(log_entry)
+        # Tests are one-off clicks; don't leave the result sitting in the buffer
+        _pi_test_logger.flush()
         # Emit result for UI
         self.test_result.emit(success, message)
 
@@ -518,10 +969,75 @@ class MainWindow(QWidget):
         self.setWindowTitle("Upload GOAT")
         self.resize(800,600)
         self.user_panels = []  # track panels for dynamic add/remove
+        self.ssh_control_path = SSH_CONTROL_PATH
+        self.ssh_cipher = ENV_SSH_CIPHER or preferred_ssh_cipher()
+        # One client (and so one HTTP connection pool) per API key, shared by every panel
+        self._client_cache: dict[str, UploadPostClient] = {}
+        # Shared pool for every panel's uploads. Upload threads spend their time blocked in
+        # socket sends with the GIL released, so size for I/O rather than cores, capped at the
+        # client's HTTPAdapter pool_maxsize so every concurrent upload keeps a pooled connection
+        QThreadPool.globalInstance().setMaxThreadCount(max(4, min(8, 2 * QThread.idealThreadCount())))
+        # Push buffered upload log lines to disk even when only a few uploads ran
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(2000)
+        self._log_flush_timer.timeout.connect(_upload_logger.flush)
+        self._log_flush_timer.start()
         self._build_ui()
+        self._start_ssh_master()
+
+    def get_client(self, api_key: str) -> UploadPostClient:
+        """Return the shared client for ``api_key``, creating it on first use."""
+        client = self._client_cache.get(api_key)
+        if client is None:
+            client = self._client_cache[api_key] = UploadPostClient(api_key)
+        return client
+
+    def _start_ssh_master(self):
+        """Open the shared SSH master connection to the Pi in the background."""
+        pi_ip = self.pi_ip_edit.text().strip()
+        if not pi_ip:
+            return
+        ssh_key = str(Path(self.ssh_key_edit.text().strip()).expanduser())
+        Path(self.ssh_control_path).parent.mkdir(mode=0o700, exist_ok=True)
+        # -f backgrounds after auth; BatchMode keeps it from prompting on the GUI's terminal
+        subprocess.Popen(
+            ["ssh", "-M", "-N", "-f", "-o", "BatchMode=yes", *ssh_throughput_args(self.ssh_cipher),
+             "-o", f"ControlPath={self.ssh_control_path}", "-o", "ControlPersist=10m",
+             "-i", ssh_key, f"pi@{pi_ip}"],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+
+    def closeEvent(self, event):
+        """Stop the log follower, close HTTP pools and tear down the shared SSH master on exit."""
+        self._stop_logs_tail()
+        self._log_flush_timer.stop()
+        _upload_logger.flush()
+        for client in self._client_cache.values():
+            client.close()
+        self._client_cache.clear()
+        if getattr(self, "logs_tail_worker", None) is not None:
+            self.logs_tail_worker.wait(2000)
+        pi_ip = self.pi_ip_edit.text().strip()
+        if pi_ip:
+            try:
+                subprocess.run(
+                    ["ssh", "-o", f"ControlPath={self.ssh_control_path}", "-O", "exit", f"pi@{pi_ip}"],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5,
+                )
+            except Exception:
+                pass
+        super().closeEvent(event)
 
     def _build_ui(self):
         main_layout = QVBoxLayout(self)
+        # Centered title and subtext
+        title_lbl = QLabel("Upload GOAT")
+        title_lbl.setAlignment(Qt.AlignCenter)
+        title_lbl.setStyleSheet("font-size: 20px; font-weight: bold;")
+        main_layout.addWidget(title_lbl)
+        subtitle_lbl = QLabel("a tool by ClipmodeGo")
+        subtitle_lbl.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(subtitle_lbl)
         # API Key and Add User controls
         top_row = QHBoxLayout()
         top_row.addWidget(QLabel("Upload-Post API Key"))
@@ -570,8 +1086,9 @@ class MainWindow(QWidget):
         self.logs_refresh_btn = QPushButton("Refresh Logs")
         self.logs_refresh_btn.clicked.connect(self.refresh_logs)
         logs_layout.addWidget(self.logs_refresh_btn)
-        self.logs_table = QTableWidget(0,5)
-        self.logs_table.setHorizontalHeaderLabels(["Timestamp","Video","User","Status","Message"])
+        self.logs_model = LogsModel(self)
+        self.logs_table = QTableView()
+        self.logs_table.setModel(self.logs_model)
         self.logs_table.horizontalHeader().setStretchLastSection(True)
         logs_layout.addWidget(self.logs_table)
         self.tabs.addTab(self.logs_tab, "Pi Logs")
@@ -585,10 +1102,20 @@ class MainWindow(QWidget):
         self._add_user_panel()
 
     def _add_user_panel(self):
-        panel = UserPanel(self.api_key_edit, self.pi_ip_edit, self.ssh_key_edit)
-        self.user_panels.append(panel)
-        self.panels_layout.addWidget(panel)
-        panel.show()
+        self.add_user_panels(1)
+
+    def add_user_panels(self, n: int):
+        """Add ``n`` user panels with a single relayout/repaint at the end."""
+        self.panels_container.setUpdatesEnabled(False)
+        try:
+            for _ in range(n):
+                panel = UserPanel(self.api_key_edit, self.get_client, self.pi_ip_edit, self.ssh_key_edit, self.ssh_control_path, self.ssh_cipher)
+                self.user_panels.append(panel)
+                self.panels_layout.addWidget(panel)
+                panel.show()
+        finally:
+            self.panels_container.setUpdatesEnabled(True)
+            self.panels_container.updateGeometry()
 
     def _remove_user_panel(self):
         """Remove the most recently added user panel."""
@@ -600,42 +1127,36 @@ class MainWindow(QWidget):
         panel.deleteLater()
 
     def refresh_logs(self):
+        """(Re)start following the Pi journal, e.g. after changing the Pi IP or key."""
+        self._stop_logs_tail()
         pi_ip = self.pi_ip_edit.text().strip()
         ssh_key = self.ssh_key_edit.text().strip()
-        self.logs_refresh_btn.setEnabled(False)
-        self.logs_table.setRowCount(0)
-        self.logs_worker = LogsWorker(pi_ip, ssh_key)
-        self.logs_worker.logs_ready.connect(self._populate_logs_table)
-        self.logs_worker.finished.connect(lambda: self.logs_refresh_btn.setEnabled(True))
-        self.logs_worker.start()
+        self.logs_model.set_rows([])
+        # Parented to the window so a replaced follower lives until its thread exits
+        self.logs_tail_worker = LogsTailWorker(pi_ip, ssh_key, self.ssh_control_path, self)
+        self.logs_tail_worker.log_row_ready.connect(self._populate_logs_table)
+        self.logs_tail_worker.finished.connect(functools.partial(self._release_logs_tail, self.logs_tail_worker))
+        self.logs_tail_worker.start()
+
+    def _stop_logs_tail(self):
+        worker = getattr(self, "logs_tail_worker", None)
+        if worker is not None:
+            # Drop rows still queued from the old follower
+            worker.log_row_ready.disconnect(self._populate_logs_table)
+            worker.stop()
+
+    def _release_logs_tail(self, worker: "LogsTailWorker"):
+        if self.logs_tail_worker is worker:
+            self.logs_tail_worker = None
+        worker.deleteLater()
 
     def _on_tab_changed(self, index):
-        if self.tabs.tabText(index) == "Pi Logs":
+        # Start the follower once; it stays alive across tab switches
+        if self.tabs.tabText(index) == "Pi Logs" and getattr(self, "logs_tail_worker", None) is None:
             self.refresh_logs()
 
-    def _populate_logs_table(self, rows):
-        self.logs_table.setRowCount(len(rows))
-        for row_idx, row in enumerate(rows):
-            ts_item = QTableWidgetItem(row.get("timestamp", ""))
-            video_item = QTableWidgetItem(row.get("video", ""))
-            user_item = QTableWidgetItem(row.get("user", ""))
-            status_item = QTableWidgetItem(row.get("status", ""))
-            msg_item = QTableWidgetItem(row.get("message", ""))
-            self.logs_table.setItem(row_idx, 0, ts_item)
-            self.logs_table.setItem(row_idx, 1, video_item)
-            self.logs_table.setItem(row_idx, 2, user_item)
-            self.logs_table.setItem(row_idx, 3, status_item)
-            self.logs_table.setItem(row_idx, 4, msg_item)
-            # Color based on status
-            if row.get("status", "") == "ok":
-                color = Qt.green
-            elif row.get("status", "") == "error":
-                color = Qt.red
-            else:
-                color = None
-            if color:
-                for item in (ts_item, video_item, user_item, status_item, msg_item):
-                    item.setBackground(color)
+    def _populate_logs_table(self, row: dict):
+        self.logs_model.append_row(row)
 
     def _test_pi_connection(self):
         pi_ip = self.pi_ip_edit.text().strip()
@@ -647,7 +1168,7 @@ class MainWindow(QWidget):
             return
         self.test_pi_btn.setEnabled(False)
         # Start test worker
-        self.pi_test_worker = PiTestWorker(pi_ip, str(ssh_path))
+        self.pi_test_worker = PiTestWorker(pi_ip, str(ssh_path), self.ssh_control_path)
         self.pi_test_worker.test_result.connect(self._on_test_result)
         self.pi_test_worker.finished.connect(lambda: self.test_pi_btn.setEnabled(True))
         self.pi_test_worker.start()
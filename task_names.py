@@ -0,0 +1,24 @@
+"""Pi queue file names, shared by the desktop app (producer) and the headless worker."""
+
+import re
+import uuid
+from typing import Optional
+
+# <epoch>.<uuid hex>[.requeued].task.json; the worker adds .requeued when it queues a
+# task abandoned mid-upload. Older desktops named tasks <video stem>.task.json, and a
+# stem can be all digits too, so only the full pattern is trusted to carry the epoch.
+_EPOCH_NAME = re.compile(r"(\d+)\.[0-9a-f]{32}(?:\.requeued)?\.task\.json")
+
+
+def task_file_name(epoch: float, requeued: bool = False) -> str:
+    """Queue file name for a task due at ``epoch``: ``<epoch>.<uuid>.task.json``.
+
+    The leading epoch lets the Pi worker skip not-yet-due tasks without opening them.
+    """
+    return f"{int(epoch)}.{uuid.uuid4().hex}{'.requeued' if requeued else ''}.task.json"
+
+
+def due_epoch(name: str) -> Optional[int]:
+    """Return the due epoch encoded in a task file name, or None if it has to come from scheduled_at."""
+    match = _EPOCH_NAME.fullmatch(name)
+    return int(match.group(1)) if match else None
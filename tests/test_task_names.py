@@ -0,0 +1,24 @@
+from task_names import due_epoch, task_file_name
+
+
+def test_new_names_carry_their_epoch():
+    name = task_file_name(1700000000.9)
+    assert name.endswith(".task.json")
+    assert due_epoch(name) == 1700000000
+
+
+def test_requeued_names_keep_their_epoch():
+    name = task_file_name(1700000000).replace(".task.json", ".requeued.task.json")
+    assert due_epoch(name) == 1700000000
+
+
+def test_digit_stem_legacy_names_fall_back_to_scheduled_at():
+    # <video stem>.task.json from older desktops; the stem is a date, not a due epoch
+    assert due_epoch("20991231.task.json") is None
+    assert due_epoch("20991231.requeued.task.json") is None
+    assert due_epoch("20991231.mp4.task.json") is None
+
+
+def test_other_names_are_not_tasks():
+    assert due_epoch("clip.task.json") is None
+    assert due_epoch(task_file_name(1700000000)[:-len(".task.json")] + ".inflight") is None
@@ -0,0 +1,83 @@
+"""UploadPostClient against a local HTTP server, through a real requests session.
+
+Run under the lowest urllib3 the requirements allow as well as the newest, e.g.
+``pip install "urllib3==1.26.0"``: pool-manager options that only exist on 2.x
+fail every request on 1.26.
+"""
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from uploader import UploadPostClient, _BulkUploadAdapter
+
+
+class _UploadHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append((self.headers, body))
+        payload = json.dumps({"success": True, "results": {}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _UploadHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client(server):
+    client = UploadPostClient("test-key")
+    client.ENDPOINT = f"http://127.0.0.1:{server.server_port}/api/upload"
+    # The client only mounts its adapter for https://; reuse it for the plain-HTTP test server
+    client.session.mount("http://", client.session.get_adapter("https://api.upload-post.com"))
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(os.urandom(3 * _BulkUploadAdapter.BLOCKSIZE + 123))
+    return path
+
+
+def test_inline_upload(client, server, video):
+    assert client.upload_video(video, "caption", "someone") == {"success": True, "results": {}}
+    headers, body = server.requests[0]
+    assert headers["Authorization"] == "Apikey test-key"
+    assert video.read_bytes() in body
+    assert b'name="platform[]"\r\n\r\ntiktok' in body
+
+
+def test_streamed_upload(client, server, video):
+    seen = []
+    client.upload_video(video, "caption", "someone", progress_callback=lambda m: seen.append(m.bytes_read))
+    _, body = server.requests[0]
+    assert video.read_bytes() in body
+    assert seen[-1] == len(body)
+
+
+def test_connections_use_bulk_blocksize(client):
+    pool = client.session.get_adapter(client.ENDPOINT).poolmanager.connection_from_url(client.ENDPOINT)
+    conn = pool._get_conn()
+    try:
+        assert conn.blocksize == _BulkUploadAdapter.BLOCKSIZE
+    finally:
+        pool._put_conn(conn)
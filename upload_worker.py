@@ -1,79 +1,351 @@
 """Headless worker that uploads queued videos to Upload-Post."""
 
-import json
+import atexit
+import signal
+import sys
+import threading
 import time
 import pathlib
 import datetime
 import traceback
-from uploader import UploadPostClient
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # not installed: fall back to timed polling
+    INotify = None
+from uploader import UploadPostClient, PermanentUploadError, RetriableUploadError
+from task_names import due_epoch, task_file_name
 from dotenv import load_dotenv
 import os
 
 # Load API key from .env
 load_dotenv()
 API_KEY = os.getenv("API_KEY", "")
-API = UploadPostClient(API_KEY)
+# Due tasks upload in parallel, each on its own pooled keep-alive connection
+UPLOAD_WORKERS = 4
+API = UploadPostClient(API_KEY, max_concurrent=UPLOAD_WORKERS)
+# Close pooled connections on exit
+atexit.register(API.close)
+# Set on SIGTERM: uploads already running finish, queued ones are dropped
+STOPPING = threading.Event()
+
+
+def stop(signum, frame):
+    """SIGTERM (systemd stop): unwind the poll loop, whose shutdown keeps only in-flight uploads."""
+    STOPPING.set()
+    # A second SIGTERM must not cut the shutdown short
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    sys.exit(0)
+
+
+signal.signal(signal.SIGTERM, stop)
 
 QUEUE_DIR = pathlib.Path("/home/pi/upload_queue")
 LOG_FILE = pathlib.Path("/home/pi/upload_logs/worker_log.jsonl")
 SLEEP_SEC = 30
+# WORKER_VERBOSE=1 adds full tracebacks to retry lines too (final failures always carry one)
+VERBOSE = os.getenv("WORKER_VERBOSE") == "1"
+TASK_READ_SIZE = 64 * 1024  # task JSONs are a few hundred bytes; one read() covers them
+# An .inflight task this process isn't uploading, claimed this long ago, was left by a crash
+INFLIGHT_STALE_SEC = 10 * 60
+# A task that used up its attempts goes back to the queue due no sooner than this
+RETRY_DEFER_SEC = 5 * 60
 
+# Task files are opened relative to this descriptor, so the kernel skips
+# resolving the full queue path on every read
+QUEUE_DIR.mkdir(parents=True, exist_ok=True)
+QUEUE_FD = os.open(QUEUE_DIR, os.O_RDONLY | os.O_DIRECTORY)
 
-def log(entry: dict):
-    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with LOG_FILE.open("a") as fp:
-        fp.write(json.dumps(entry) + "\n")
+# Wake as soon as scp/tar finishes writing a task instead of on the next 30 s tick
+if INotify is not None:
+    QUEUE_WATCH = INotify()
+    QUEUE_WATCH.add_watch(str(QUEUE_DIR), inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+else:
+    QUEUE_WATCH = None
 
 
-while True:
-    for task_path in QUEUE_DIR.glob("*.task.json"):
+def read_task(name: str) -> dict:
+    """Read and parse one task file from the queue with a single open/read/close."""
+    fd = os.open(name, os.O_RDONLY, dir_fd=QUEUE_FD)
+    try:
+        data = chunk = os.read(fd, TASK_READ_SIZE)
+        # Regular files only read short at EOF; a full buffer means there may be more
+        while len(chunk) == TASK_READ_SIZE:
+            chunk = os.read(fd, TASK_READ_SIZE)
+            data += chunk
+    finally:
+        os.close(fd)
+    return orjson.loads(data)
+
+
+def remove_queued(*names: str):
+    """Unlink finished queue files relative to QUEUE_FD, ignoring ones already gone."""
+    for name in names:
         try:
-            task = json.loads(task_path.read_text())
-            sched = datetime.datetime.fromisoformat(task["scheduled_at"])
-            now = datetime.datetime.now(sched.tzinfo)
-            if now < sched:
-                continue  # not time yet
-
-            video_path = task_path.with_name(task["video"])
-            # Attempt upload with retries and exponential back-off
-            success = False
-            for attempt in range(1, 4):  # max 3 tries
-                try:
-                    # Attempt upload and check for platform-level errors
-                    resp = API.upload_video(
-                        video_path=str(video_path),
-                        caption=task["caption"],
-                        user=task["user"]
-                    )
-                    # If API did not report top-level success, raise to retry
-                    if not resp.get("success"):
-                        raise RuntimeError(f"Upload-Post reported failure: {resp}")
-                    # Check per-platform responses
-                    errors = []
-                    for plat, plat_data in resp.get("results", {}).items():
-                        if not plat_data.get("success"):
-                            err = plat_data.get("error", "Unknown platform error")
-                            errors.append(f"{plat}: {err}")
-                    if errors:
-                        raise RuntimeError("; ".join(errors))
-                    # All platforms succeeded
-                    success = True
-                    log({**task, "status": "ok", "attempt": attempt, "timestamp": datetime.datetime.now().isoformat()})
+            os.unlink(name, dir_fd=QUEUE_FD)
+        except FileNotFoundError:
+            pass
+
+
+EXECUTOR = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS, thread_name_prefix="upload")
+# .inflight names this process is uploading, so the stale sweep leaves them alone
+IN_FLIGHT = set()
+IN_FLIGHT_LOCK = threading.Lock()
+LOG_LOCK = threading.Lock()
+# .task.json names the worker moved into the queue itself; their inotify events don't wake the poll loop
+OWN_RENAMES = set()
+OWN_RENAMES_LOCK = threading.Lock()
+# Task file name -> (mtime_ns, scheduled epoch, parsed task); only the poll loop touches it
+SCHED_CACHE: dict[str, tuple[int, float, dict]] = {}
+
+# One line-buffered handle for the worker's lifetime instead of open/close per entry
+LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+# orjson writes non-ASCII captions as raw UTF-8 rather than \u escapes
+LOG_FP = LOG_FILE.open("a", buffering=1, encoding="utf-8")
+atexit.register(LOG_FP.close)
+
+
+def task_log_base(task: dict) -> str:
+    """Serialize a task once as the shared prefix of its log lines (the object minus its closing brace)."""
+    return orjson.dumps(task)[:-1].decode() + ","
+
+
+def log(entry: dict, base: str = "{"):
+    """Append ``entry`` as one JSONL line; ``base`` from task_log_base() merges in the task fields."""
+    line = base + orjson.dumps(entry).decode()[1:] + "\n"
+    # Upload threads log concurrently; serialize so JSONL lines never interleave
+    with LOG_LOCK:
+        LOG_FP.write(line)
+        # Final outcomes must survive a power cut; retries can ride the page cache
+        if entry.get("status") in ("ok", "error"):
+            os.fsync(LOG_FP.fileno())
+
+
+def requeue_as(name: str, task_name: str):
+    """Rename a queue file to ``task_name`` without the rename waking the poll loop."""
+    if QUEUE_WATCH is None:
+        # Polling only: no event will ever come to take the name back out of OWN_RENAMES
+        os.rename(name, task_name, src_dir_fd=QUEUE_FD, dst_dir_fd=QUEUE_FD)
+        return
+    with OWN_RENAMES_LOCK:
+        OWN_RENAMES.add(task_name)
+    try:
+        os.rename(name, task_name, src_dir_fd=QUEUE_FD, dst_dir_fd=QUEUE_FD)
+    except OSError:
+        with OWN_RENAMES_LOCK:
+            OWN_RENAMES.discard(task_name)
+        raise
+
+
+def new_task_arrived(events) -> bool:
+    """True if ``events`` include a task file the worker didn't put there itself."""
+    arrived = False
+    with OWN_RENAMES_LOCK:
+        for event in events:
+            if event.mask & inotify_flags.Q_OVERFLOW:
+                # Events were dropped, including some for OWN_RENAMES names; rescan to be safe
+                OWN_RENAMES.clear()
+                arrived = True
+            elif event.name in OWN_RENAMES:
+                OWN_RENAMES.discard(event.name)
+            elif event.name.endswith(".task.json"):
+                arrived = True
+    return arrived
+
+
+def wait_for_queue(timeout):
+    """Block until a new task arrives or ``timeout`` seconds pass (None: until one arrives)."""
+    if QUEUE_WATCH is None:
+        time.sleep(SLEEP_SEC if timeout is None else min(timeout, SLEEP_SEC))
+        return
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        remaining = None if deadline is None else max(0, deadline - time.monotonic())
+        # read_delay lets a bulk tar transfer's burst of files arrive as one wakeup
+        events = QUEUE_WATCH.read(timeout=None if remaining is None else int(remaining * 1000), read_delay=100)
+        # Videos, .inflight claims, .failed parking and the worker's own requeues are ignored
+        if not events or new_task_arrived(events):
+            return
+
+
+def requeue_stale(entries, now_ts) -> bool:
+    """Give .inflight tasks abandoned by a crashed worker one more upload, parking repeat offenders as .failed.
+
+    Returns True while some abandoned task is still too recent to touch, or was just requeued.
+    """
+    pending = False
+    for entry in entries:
+        with IN_FLIGHT_LOCK:
+            if entry.name in IN_FLIGHT:
+                continue  # still uploading in this process
+        try:
+            # rename() updates ctime, so it records when the task was claimed
+            if now_ts - entry.stat(follow_symlinks=False).st_ctime < INFLIGHT_STALE_SEC:
+                pending = True
+                continue
+            stem = entry.name[:-len(".inflight")]
+            # The crash may have come after the post went through; only re-upload once
+            if stem.endswith(".requeued"):
+                os.rename(entry.name, stem[:-len(".requeued")] + ".failed", src_dir_fd=QUEUE_FD, dst_dir_fd=QUEUE_FD)
+                log({"status": "error", "error": f"{entry.name} abandoned mid-upload twice; parked as .failed", "timestamp": datetime.datetime.now().isoformat()})
+            else:
+                requeue_as(entry.name, stem + ".requeued.task.json")
+                pending = True
+                log({"status": "requeued", "error": f"{entry.name} abandoned mid-upload; queued again", "timestamp": datetime.datetime.now().isoformat()})
+        except FileNotFoundError:
+            pass  # finished (or was removed) since the directory was listed
+    return pending
+
+
+def process_task(name: str, task: dict):
+    """Upload one claimed (.inflight) task with retries, then remove it from the queue on success."""
+    stem = name[:-len(".inflight")]
+    try:
+        video_path = QUEUE_DIR / task["video"]
+        base = task_log_base(task)
+        # Attempt upload with retries and exponential back-off
+        success = False
+        rejected = None  # PermanentUploadError that ended the attempts, if any
+        stopped = False  # shutdown cut the back-off short; not a failure
+        last_error = None
+        for attempt in range(1, 4):  # max 3 tries
+            try:
+                # Attempt upload and check for platform-level errors
+                resp = API.upload_video(
+                    video_path=video_path,
+                    caption=task["caption"],
+                    user=task["user"]
+                )
+                # If API did not report top-level success, raise to retry
+                if not resp.get("success"):
+                    raise RuntimeError(f"Upload-Post reported failure: {resp}")
+                # Check per-platform responses
+                errors = []
+                for plat, plat_data in resp.get("results", {}).items():
+                    if not plat_data.get("success"):
+                        err = plat_data.get("error", "Unknown platform error")
+                        errors.append(f"{plat}: {err}")
+                if errors:
+                    raise RuntimeError("; ".join(errors))
+                # All platforms succeeded
+                success = True
+                log({"status": "ok", "attempt": attempt, "timestamp": datetime.datetime.now().isoformat()}, base)
+                break
+            except PermanentUploadError as e:
+                # 4xx: re-sending the whole video would be rejected again
+                rejected = e
+                break
+            except Exception as e:
+                # Log retry attempt; the traceback is only formatted if the task ends up failing
+                last_error = e
+                entry = {"status": "retry", "attempt": attempt, "error": str(e), "error_type": type(e).__name__, "timestamp": datetime.datetime.now().isoformat()}
+                if VERBOSE:
+                    entry["trace"] = traceback.format_exc()
+                log(entry, base)
+                # Honour the server's Retry-After when it sent one; stop retrying on shutdown
+                delay = e.retry_after if isinstance(e, RetriableUploadError) else None
+                if STOPPING.wait(2 ** attempt if delay is None else delay):
+                    stopped = True
                     break
-                except Exception as e:
-                    # Log retry attempt
-                    log({**task, "status": "retry", "attempt": attempt, "error": str(e), "trace": traceback.format_exc(), "timestamp": datetime.datetime.now().isoformat()})
-                    time.sleep(2 ** attempt)
-            if success:
-                # Remove files on success
+        if success:
+            # Remove files on success; the task goes first so a crash in between
+            # leaves an orphaned video rather than a task that would upload twice
+            remove_queued(name, task["video"])
+        elif rejected is not None:
+            # Park rejected tasks as .failed so later polls don't re-stream the video
+            trace = "".join(traceback.format_exception(type(rejected), rejected, rejected.__traceback__))
+            log({"status": "error", "attempt": attempt, "error": str(rejected), "trace": trace, "timestamp": datetime.datetime.now().isoformat()}, base)
+            os.rename(name, stem + ".failed", src_dir_fd=QUEUE_FD, dst_dir_fd=QUEUE_FD)
+        elif stopped:
+            # Shutting down mid back-off: hand the task back as it was, due again on restart
+            os.rename(name, stem + ".task.json", src_dir_fd=QUEUE_FD, dst_dir_fd=QUEUE_FD)
+        else:
+            # After final failure, log error and hand the task back to the queue under a
+            # future epoch name, so an outage doesn't turn into back-to-back retry rounds
+            trace = "".join(traceback.format_exception(type(last_error), last_error, last_error.__traceback__))
+            delay = getattr(last_error, "retry_after", None) or 0
+            retry_ts = time.time() + max(RETRY_DEFER_SEC, delay)
+            log({"status": "error", "error": str(last_error), "trace": trace, "retry_at": datetime.datetime.fromtimestamp(retry_ts).isoformat(), "timestamp": datetime.datetime.now().isoformat()}, base)
+            requeue_as(name, task_file_name(retry_ts, requeued=stem.endswith(".requeued")))
+    except Exception as e:
+        log({"status": "error", "error": str(e), "trace": traceback.format_exc(), "timestamp": datetime.datetime.now().isoformat()})
+    finally:
+        with IN_FLIGHT_LOCK:
+            IN_FLIGHT.discard(name)
+
+
+try:
+    while True:
+        # An upload running now may end by requeuing its task under a deferred name, and that
+        # rename doesn't wake the loop; checked before listing so one finishing mid-pass counts
+        with IN_FLIGHT_LOCK:
+            uploading = bool(IN_FLIGHT)
+        # One directory read; DirEntry carries the name and type, so no per-file stat or Path
+        with os.scandir(QUEUE_DIR) as it:
+            listing = [e for e in it if e.name.endswith((".task.json", ".inflight")) and e.is_file(follow_symlinks=False)]
+        entries = [e for e in listing if e.name.endswith(".task.json")]
+        now_ts = time.time()
+        next_due = None  # earliest epoch among tasks that aren't due yet
+        # Unreadable tasks or too-recent abandoned ones remain, so poll again after SLEEP_SEC
+        recheck = requeue_stale([e for e in listing if e.name.endswith(".inflight")], now_ts)
+        for entry in entries:
+            # <epoch>.<uuid>.task.json: skip future tasks without opening them; older
+            # <video>.task.json names fall through to the scheduled_at check below
+            epoch = due_epoch(entry.name)
+            if epoch is not None and epoch > now_ts:
+                next_due = epoch if next_due is None else min(next_due, epoch)
+                continue
+            try:
+                # Re-read and re-parse a task only when it is new or its file changed
+                mtime_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+                cached = SCHED_CACHE.get(entry.name)
+                if cached is None or cached[0] != mtime_ns:
+                    task = read_task(entry.name)
+                    # The file name already carries the schedule; only old-style names need the ISO parse
+                    if epoch is not None:
+                        sched_ts = epoch
+                    else:
+                        sched_ts = datetime.datetime.fromisoformat(task["scheduled_at"]).timestamp()
+                    cached = SCHED_CACHE[entry.name] = (mtime_ns, sched_ts, task)
+                _, sched_ts, task = cached
+                if now_ts < sched_ts:
+                    next_due = sched_ts if next_due is None else min(next_due, sched_ts)
+                    continue  # not time yet
+                # Claim the task with one atomic rename: later polls no longer list it, and
+                # a crash mid-upload leaves an .inflight file instead of a task to post again
+                inflight = entry.name[:-len(".task.json")] + ".inflight"
+                with IN_FLIGHT_LOCK:
+                    IN_FLIGHT.add(inflight)
                 try:
-                    video_path.unlink(missing_ok=True)
-                    task_path.unlink(missing_ok=True)
-                except Exception:
-                    pass
-            else:
-                # After final failure, log error and leave files for manual retry
-                log({**task, "status": "error", "timestamp": datetime.datetime.now().isoformat()})
-        except Exception as e:
-            log({"status": "error", "error": str(e), "trace": traceback.format_exc(), "timestamp": datetime.datetime.now().isoformat()})
-    time.sleep(SLEEP_SEC) 
\ No newline at end of file
+                    os.rename(entry.name, inflight, src_dir_fd=QUEUE_FD, dst_dir_fd=QUEUE_FD)
+                except OSError:
+                    with IN_FLIGHT_LOCK:
+                        IN_FLIGHT.discard(inflight)
+                    raise
+                EXECUTOR.submit(process_task, inflight, task)
+                uploading = True
+            except Exception as e:
+                recheck = True
+                log({"status": "error", "error": str(e), "trace": traceback.format_exc(), "timestamp": datetime.datetime.now().isoformat()})
+        # Forget tasks that were claimed, uploaded and unlinked (or removed by hand)
+        for name in SCHED_CACHE.keys() - {e.name for e in entries}:
+            del SCHED_CACHE[name]
+        # Sleep until the next task is due or a new one arrives; an empty queue waits indefinitely
+        timeout = None if next_due is None else max(0, next_due - time.time())
+        if recheck:
+            timeout = SLEEP_SEC if timeout is None else min(timeout, SLEEP_SEC)
+        # Poll while uploads run so a deferred requeue is listed before it falls due
+        if uploading:
+            cap = min(SLEEP_SEC, RETRY_DEFER_SEC)
+            timeout = cap if timeout is None else min(timeout, cap)
+        wait_for_queue(timeout)
+finally:
+    # Wait only for uploads already running; tasks claimed but never started go back to the queue
+    STOPPING.set()
+    EXECUTOR.shutdown(wait=True, cancel_futures=True)
+    for name in IN_FLIGHT:
+        try:
+            os.rename(name, name[:-len(".inflight")] + ".task.json", src_dir_fd=QUEUE_FD, dst_dir_fd=QUEUE_FD)
+        except FileNotFoundError:
+            pass
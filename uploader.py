@@ -1,19 +1,139 @@
+import mmap
+import os
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError  # for improved error handling
 from pathlib import Path
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Sequence
 from requests_toolbelt.multipart.encoder import MultipartEncoder, MultipartEncoderMonitor
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+# posix_fadvise/madvise exist on Linux (the Pi) but not on Windows or macOS desktops
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+_HAS_MADV_SEQUENTIAL = hasattr(mmap, "MADV_SEQUENTIAL")
+
+
+class RetriableUploadError(RuntimeError):
+    """Upload failed in a way that may succeed later (network, timeout, 5xx, 408/429).
+
+    ``retry_after`` is the server's requested delay in seconds, when it gave one.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class PermanentUploadError(RuntimeError):
+    """Upload was rejected (4xx); sending the same request again will not help."""
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Seconds from a numeric Retry-After header, or None."""
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return None
+
+
+class _MappedFile:
+    """Read-only file-like view over an mmap for MultipartEncoder.
+
+    The encoder sizes streamed parts by ``len`` and keeps reading until it reaches 0,
+    so it reports the unread remainder rather than the mapping's full length.
+    """
+
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+
+    @property
+    def len(self) -> int:
+        return len(self._mm) - self._mm.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        return self._mm.read(size)
+
+
+class _BulkHTTPConnection(HTTPConnection):
+    """urllib3 connection that reads and sends request bodies in BLOCKSIZE blocks.
+
+    Set on the connection itself: urllib3 1.26 has no ``blocksize`` pool key and
+    rejects it as a pool-manager kwarg on every request.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.blocksize = _BulkUploadAdapter.BLOCKSIZE
+
+
+class _BulkHTTPSConnection(HTTPSConnection):
+    """TLS counterpart of _BulkHTTPConnection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.blocksize = _BulkUploadAdapter.BLOCKSIZE
+
+
+class _BulkHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _BulkHTTPConnection
+
+
+class _BulkHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _BulkHTTPSConnection
+
+
+class _BulkUploadAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections send streamed bodies in large blocks.
+
+    http.client/urllib3 read and send() a streamed body 8-16 KiB at a time by default;
+    multi-hundred-MB videos then cost tens of thousands of Python-level reads and
+    syscalls. Every pooled connection is created with a BLOCKSIZE ``blocksize``
+    (works on urllib3 1.26 and 2.x).
+    """
+
+    BLOCKSIZE = 256 * 1024
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _BulkHTTPConnectionPool,
+            "https": _BulkHTTPSConnectionPool,
+        }
 
 
 class UploadPostClient:
     """Simple wrapper around the Upload-Post REST API."""
 
     ENDPOINT = "https://api.upload-post.com/api/upload"
+    # requests' native files= form builds the whole body in memory, so it is only used
+    # for files up to this size; larger videos always stream through MultipartEncoder
+    INLINE_UPLOAD_MAX = 16 * 1024 * 1024
+    # urllib3 retries only failures to *connect*: no body bytes have been read then.
+    # A streamed body can't be rewound, so read errors and bad statuses are left to the
+    # caller, which rebuilds the request (see RetriableUploadError)
+    CONNECT_RETRY = Retry(total=None, connect=3, read=0, status=0, other=0, redirect=0, backoff_factor=1)
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_concurrent: int = 8, default_platforms: Sequence[str] = ("tiktok",)):
         if not api_key:
             raise ValueError("API_KEY missing – add it to a .env file or environment variables.")
-        self.headers = {"Authorization": f"Apikey {api_key}"}
+        # Pooled keep-alive connections so consecutive uploads skip the TCP + TLS handshake.
+        # Every upload goes to one host, so a single host pool holding one kept-alive
+        # connection per concurrent upload is enough: after the first round each upload
+        # thread reuses its warm TLS connection instead of handshaking again
+        self.session = requests.Session()
+        self.session.headers.update({"Authorization": f"Apikey {api_key}"})
+        self.session.mount(
+            "https://",
+            _BulkUploadAdapter(pool_connections=1, pool_maxsize=max_concurrent, max_retries=self.CONNECT_RETRY),
+        )
+        # platform[] fields for calls that don't pick platforms (every worker upload)
+        self._default_platform_fields = [("platform[]", plat) for plat in default_platforms]
+
+    def close(self):
+        """Close pooled HTTP connections."""
+        self.session.close()
 
     def upload_video(
         self,
@@ -21,7 +141,7 @@ class UploadPostClient:
         caption: str,
         user: str,
         platforms: Optional[List[str]] = None,
-        progress_callback: Optional[Callable[[int, int], None]] = None,
+        progress_callback: Optional[Callable[[MultipartEncoderMonitor], None]] = None,
     ) -> dict:
         """Upload a single video file to TikTok via Upload-Post.
 
@@ -34,60 +154,105 @@ class UploadPostClient:
         user : str
             Your Upload-Post username.
         platforms : List[str], optional
-            List of platform strings; the Upload-Post API expects a list-style field name, by default None.
-        progress_callback : Callable[[int, int], None], optional
-            Callback function to handle progress updates, by default None.
+            List of platform strings; the Upload-Post API expects a list-style field name,
+            by default None (the client's default_platforms, TikTok unless configured).
+        progress_callback : Callable[[MultipartEncoderMonitor], None], optional
+            Called with the streaming monitor as the body is read; ``monitor.bytes_read``
+            and ``monitor.len`` give bytes sent so far and the total, by default None.
 
         Returns
         -------
         dict
             JSON response parsed into a Python dict.
+
+        Raises
+        ------
+        RetriableUploadError
+            Network failure, timeout, HTTP 5xx, 408 or 429.
+        PermanentUploadError
+            Any other HTTP 4xx, including 401 for a bad API key.
         """
-        if not video_path.exists():
-            raise FileNotFoundError(f"Video file not found: {video_path}")
+        try:
+            size = video_path.stat().st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Video file not found: {video_path}") from None
 
-        # Prepare multipart fields
-        if platforms is None:
-            platforms = ["tiktok"]
-        # Build fields list including video
+        # Build text fields; the video part is added below
         fields: List = [
             ("title", caption),
             ("user", user),
         ]
-        for plat in platforms:
-            fields.append(("platform[]", plat))
-        # Attach video file
-        fields.append((
-            "video",
-            (video_path.name, video_path.open("rb"), "video/mp4"),
-        ))
-
-        # Use MultipartEncoder for all uploads (enables progress monitoring)
-        encoder = MultipartEncoder(fields=fields)
-        # If a callback is provided, wrap in a monitor
-        if progress_callback:
-            monitor = MultipartEncoderMonitor(encoder, lambda m: progress_callback(m.bytes_read, m.len))
-            body = monitor
+        if platforms is None:
+            fields += self._default_platform_fields
         else:
-            body = encoder
-
-        headers = self.headers.copy()
-        headers["Content-Type"] = encoder.content_type
-
-        response = requests.post(
-            self.ENDPOINT,
-            headers=headers,
-            data=body,
-            timeout=120,
-        )
+            fields += [("platform[]", plat) for plat in platforms]
+        try:
+            response = self._send(video_path, size, fields, progress_callback)
+        except (requests.ConnectionError, requests.Timeout) as err:
+            raise RetriableUploadError(f"Upload-Post unreachable: {err}") from err
 
-        # Raise HTTP errors, but convert 401 into a clearer message
+        # Raise HTTP errors, classified so callers know whether a retry can help
         try:
             response.raise_for_status()
         except HTTPError as http_err:
-            if response.status_code == 401:
-                raise RuntimeError(
+            status = response.status_code
+            if status == 401:
+                raise PermanentUploadError(
                     "Upload-Post API Unauthorized (401) – check your API_KEY and ensure it's correct"
                 ) from http_err
-            raise
-        return response.json() 
\ No newline at end of file
+            if status >= 500 or status in (408, 429):
+                raise RetriableUploadError(
+                    f"Upload-Post returned HTTP {status}",
+                    retry_after=_retry_after(response),
+                ) from http_err
+            raise PermanentUploadError(f"Upload-Post rejected the upload (HTTP {status}): {response.text[:200]}") from http_err
+        return response.json()
+
+    def _send(self, video_path: Path, size: int, fields: List, progress_callback) -> requests.Response:
+        """POST the multipart upload, choosing native or streamed encoding."""
+        with video_path.open("rb") as fh:
+            # Videos are read once, front to back: ask for aggressive readahead and drop the
+            # pages afterwards so a large upload doesn't evict everything else on a small Pi
+            if _HAS_FADVISE:
+                os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            try:
+                video = (video_path.name, fh, "video/mp4")
+                if progress_callback is None and size <= self.INLINE_UPLOAD_MAX:
+                    # Small headless uploads: plain requests encoding, far cheaper on CPU
+                    return self.session.post(
+                        self.ENDPOINT,
+                        data=fields,
+                        files={"video": video},
+                        timeout=120,
+                    )
+                else:
+                    # Map the file so the encoder's reads come straight from the page cache
+                    # instead of through a second userspace buffer (empty files can't be mapped)
+                    mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+                    try:
+                        if mm is not None:
+                            if _HAS_MADV_SEQUENTIAL:
+                                mm.madvise(mmap.MADV_SEQUENTIAL)
+                            video = (video_path.name, _MappedFile(mm), "video/mp4")
+                        # MultipartEncoder streams the file in chunks (and enables progress monitoring)
+                        encoder = MultipartEncoder(fields=fields + [("video", video)])
+                        # If a callback is provided, wrap in a monitor; the file is still streamed in chunks
+                        if progress_callback:
+                            body = MultipartEncoderMonitor(encoder, progress_callback)
+                        else:
+                            body = encoder
+
+                        headers = {"Content-Type": encoder.content_type}
+
+                        return self.session.post(
+                            self.ENDPOINT,
+                            headers=headers,
+                            data=body,
+                            timeout=120,
+                        )
+                    finally:
+                        if mm is not None:
+                            mm.close()
+            finally:
+                if _HAS_FADVISE:
+                    os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)